@@ -0,0 +1,242 @@
+"""
+Offline benchmark for the LLM Debate Arena.
+
+Starts a local OpenAI-compatible fake streaming server with configurable
+latency, points both debate clients at it and runs run_debate end to end.
+Because the server's timing is known, whatever time is left over is
+orchestration and rendering overhead in llm_debate.py.
+
+Usage:
+    python bench_debate.py                       # run the benchmark
+    python bench_debate.py --max-overhead 0.05   # fail if per-turn overhead exceeds 50 ms
+    python bench_debate.py --serve               # only run the fake server (e.g. for the UI)
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# ───────────────────────────────────────────────────────────────
+# Fake OpenAI-compatible Server
+# ───────────────────────────────────────────────────────────────
+def make_handler(ttft: float, token_delay: float, tokens: int):
+    """Build a request handler that streams `tokens` chunks with the given latency."""
+
+    class FakeChatHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_POST(self):
+            if not self.path.endswith("/chat/completions"):
+                self.send_error(404)
+                return
+
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            model = body.get("model", "fake-model")
+            words = [f"word{i} " for i in range(tokens)]
+
+            time.sleep(ttft)
+
+            if not body.get("stream"):
+                self._send_json({
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(words)},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": tokens, "total_tokens": tokens},
+                })
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+
+            for i, word in enumerate(words):
+                if i:
+                    time.sleep(token_delay)
+                self._send_event(self._chunk(model, {"content": word}, None))
+            self._send_event(self._chunk(model, {}, "stop"))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+            self.close_connection = True
+
+        def _chunk(self, model: str, delta: dict, finish_reason):
+            return {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        def _send_event(self, payload: dict):
+            self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        def _send_json(self, payload: dict):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return FakeChatHandler
+
+
+def start_server(port: int, ttft: float, token_delay: float, tokens: int) -> ThreadingHTTPServer:
+    """Start the fake server on a background thread and return it."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(ttft, token_delay, tokens))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ───────────────────────────────────────────────────────────────
+# Benchmark
+# ───────────────────────────────────────────────────────────────
+def run_benchmark(args) -> dict:
+    """Run the debate `args.repeat` times against the fake server and summarize the timings."""
+    # Must be set before llm_debate is imported - it builds its clients at import time
+    import llm_debate
+
+    results = []
+    for _ in range(args.repeat):
+        open(llm_debate.METRICS_FILE, "w").close()
+
+        yields = 0
+        bytes_yielded = 0
+        start = time.perf_counter()
+        for output in llm_debate.run_debate(
+                "Is benchmarking worth it?",
+                "You argue yes.",
+                "You argue no.",
+                llm_debate.DEFAULT_LLM1_MODEL,
+                llm_debate.DEFAULT_LLM2_MODEL,
+                args.rounds,
+                use_cache=False,
+                context_strategy=args.context_strategy,
+                llm1_budget=args.token_budget,
+                llm2_budget=args.token_budget,
+                progress=lambda *a, **kw: None,
+        ):
+            yields += 1
+            bytes_yielded += len(output)
+        wall = time.perf_counter() - start
+
+        with open(llm_debate.METRICS_FILE, encoding="utf-8") as f:
+            turns = [json.loads(line) for line in f if line.strip()]
+
+        if not turns:
+            raise SystemExit("FAIL: debate produced no turns")
+        errors = sum(1 for t in turns if t["error"])
+        if errors:
+            results.append({"wall": wall, "turns": len(turns), "errors": errors})
+            continue
+
+        # Time the fake server itself spends per turn; everything else is client-side overhead
+        server_time = args.ttft + max(args.tokens - 1, 0) * args.token_delay
+        answered = [t for t in turns if t["ttft"] is not None]
+        results.append({
+            "wall": wall,
+            "turns": len(turns),
+            "errors": 0,
+            "yields": yields,
+            "bytes_yielded": bytes_yielded,
+            "ttft_overhead": sum(t["ttft"] - args.ttft for t in answered) / len(answered) if answered else 0.0,
+            "overhead_per_turn": (wall - server_time * len(turns)) / len(turns),
+            "consumer_per_turn": sum(t["consumer_time"] for t in turns) / len(turns),
+            "context_per_turn": sum(t["context_time"] for t in turns) / len(turns),
+            "tokens_per_sec": sum(t["tokens_per_sec"] for t in turns) / len(turns),
+        })
+
+    failed = [r for r in results if r["errors"]]
+    if failed:
+        return {**failed[0], "runs": len(results)}
+    best = min(results, key=lambda r: r["wall"])
+    return {**best, "runs": len(results)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmark for llm_debate.run_debate")
+    parser.add_argument("--rounds", type=int, default=3, help="debate rounds per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs to perform; the fastest is reported")
+    parser.add_argument("--ttft", type=float, default=0.05, help="fake server time to first token (s)")
+    parser.add_argument("--token-delay", type=float, default=0.002, help="fake server delay between tokens (s)")
+    parser.add_argument("--tokens", type=int, default=200, help="tokens streamed per reply")
+    parser.add_argument("--context-strategy", default="full", help="context strategy passed to run_debate")
+    parser.add_argument("--token-budget", type=int, default=0, help="token budget for both models (0 = model default)")
+    parser.add_argument("--port", type=int, default=0, help="fake server port (0 = pick a free port)")
+    parser.add_argument("--max-overhead", type=float, default=None,
+                        help="fail if client overhead per turn exceeds this many seconds")
+    parser.add_argument("--serve", action="store_true", help="only run the fake server until interrupted")
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.ttft, args.token_delay, args.tokens)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    if args.serve:
+        print(f"Fake OpenAI-compatible server listening on {base_url}")
+        print(f"  GROQ_BASE_URL={base_url}/openai/v1")
+        print(f"  OPENAI_BASE_URL={base_url}/v1")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    metrics_file = tempfile.NamedTemporaryFile(prefix="llm_debate_metrics_", suffix=".jsonl", delete=False)
+    metrics_file.close()
+    os.environ.update({
+        "GROQ_API_KEY": "fake",
+        "OPENAI_API_KEY": "fake",
+        "GROQ_BASE_URL": f"{base_url}/openai/v1",
+        "OPENAI_BASE_URL": f"{base_url}/v1",
+        "LLM_CACHE_DISABLED": "1",
+        "LLM_TURN_DELAY": "0",
+        "LLM_METRICS_FILE": metrics_file.name,
+    })
+
+    try:
+        result = run_benchmark(args)
+    finally:
+        server.shutdown()
+        os.unlink(metrics_file.name)
+
+    print(f"Runs:                {result['runs']} (fastest reported)")
+    print(f"Turns:               {result['turns']} ({result['errors']} errors)")
+    print(f"Wall time:           {result['wall']:.3f}s")
+
+    if result["errors"]:
+        print("FAIL: turns returned errors")
+        return 1
+
+    print(f"Overhead per turn:   {result['overhead_per_turn'] * 1000:.1f} ms")
+    print(f"  rendering:         {result['consumer_per_turn'] * 1000:.1f} ms")
+    print(f"  context:           {result['context_per_turn'] * 1000:.1f} ms")
+    print(f"TTFT overhead:       {result['ttft_overhead'] * 1000:.1f} ms")
+    print(f"Tokens/sec:          {result['tokens_per_sec']:.1f}")
+    print(f"UI updates:          {result['yields']} ({result['bytes_yielded'] / 1024:.0f} KiB rendered)")
+    if args.max_overhead is not None and result["overhead_per_turn"] > args.max_overhead:
+        print(f"FAIL: overhead per turn exceeds {args.max_overhead * 1000:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,13 @@ LLM Debate Arena - Watch two AI models debate any topic with custom personalitie
 See README.md for full documentation and setup instructions.
 """
 
+import hashlib
+import json
 import os
 import sys
+import threading
 import time
+from pathlib import Path
 from typing import Generator
 from dotenv import load_dotenv
 import gradio as gr
@@ -23,7 +27,10 @@ if not GROQ_API_KEY or not OPENAI_API_KEY:
     print("Missing GROQ_API_KEY or OPENAI_API_KEY in .env file!")
     sys.exit(1)
 
-groq_client = OpenAI(base_url="https://api.groq.com/openai/v1", api_key=GROQ_API_KEY)
+# Base URLs can be overridden to point at a local OpenAI-compatible server (see bench_debate.py)
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+
+groq_client = OpenAI(base_url=GROQ_BASE_URL, api_key=GROQ_API_KEY)
 openai_client = OpenAI(api_key=OPENAI_API_KEY)
 
 # ───────────────────────────────────────────────────────────────
@@ -32,6 +39,34 @@ openai_client = OpenAI(api_key=OPENAI_API_KEY)
 DEFAULT_LLM1_MODEL = "llama-3.3-70b-versatile"
 DEFAULT_LLM2_MODEL = "gpt-4o-mini"
 DEFAULT_ROUNDS = 3
+DEFAULT_TEMPERATURE = 0.75
+DEFAULT_MAX_TOKENS = 1024
+TURN_DELAY = float(os.getenv("LLM_TURN_DELAY", "0.3"))
+
+# Per-turn metrics are appended here as JSON lines when set
+METRICS_FILE = os.getenv("LLM_METRICS_FILE", "")
+
+# Response cache - set LLM_CACHE_DISABLED=1 to always hit the live APIs
+CACHE_DIR = Path(os.getenv("LLM_CACHE_DIR", Path(__file__).parent / ".llm_cache"))
+CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "500"))
+CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+CACHE_ENABLED = os.getenv("LLM_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+
+# Context management - prompt token budget per model (approximate tokens)
+CONTEXT_STRATEGIES = ["full", "sliding_window", "summarize"]
+DEFAULT_CONTEXT_STRATEGY = "full"
+DEFAULT_TOKEN_BUDGET = 4000
+# Cost-oriented defaults used when a trimming strategy is picked without a budget
+MODEL_TOKEN_BUDGETS = {
+    "llama-3.3-70b-versatile": DEFAULT_TOKEN_BUDGET,
+    "gpt-4o-mini": DEFAULT_TOKEN_BUDGET,
+}
+# Hard cap on any budget: context window minus room for the reply
+MODEL_CONTEXT_WINDOWS = {
+    "llama-3.3-70b-versatile": 131072,
+    "gpt-4o-mini": 128000,
+}
+SUMMARY_MAX_TOKENS = 300
 
 
 # ───────────────────────────────────────────────────────────────
@@ -79,24 +114,420 @@ def validate_and_sanitize(text: str, field_name: str, max_length: int = 2000) ->
     return text, ""
 
 
+# ───────────────────────────────────────────────────────────────
+# Response Cache
+# ───────────────────────────────────────────────────────────────
+class ResponseCache:
+    """
+    Disk-backed, content-addressed cache of streamed LLM replies.
+
+    Each entry is a JSON file named by the SHA-256 of the request
+    (provider, model, messages, temperature, max_tokens) holding the
+    original token chunks, so a hit can be replayed as a stream.
+    Least-recently-used entries are evicted once the entry count or
+    total size limit is exceeded (file mtime is bumped on every hit).
+    """
+
+    def __init__(self, directory: Path, max_entries: int, max_bytes: int, enabled: bool = True):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(provider: str, model: str, messages: list, temperature: float, max_tokens: int) -> str:
+        """Hash the request parameters into a stable cache key."""
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str, count: bool = True) -> list[str] | None:
+        """Return the cached token chunks for key, or None on a miss. count=False skips the hit/miss stats."""
+        path = self._path(key)
+        try:
+            chunks = json.loads(path.read_text(encoding="utf-8"))["chunks"]
+        except (OSError, ValueError, KeyError):
+            if count:
+                with self._lock:
+                    self.misses += 1
+            return None
+
+        # Bump mtime for LRU eviction; a read-only cache dir still serves hits
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        if count:
+            with self._lock:
+                self.hits += 1
+        return chunks
+
+    def put(self, key: str, chunks: list[str]) -> None:
+        """Store a completed reply and evict old entries if over budget."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(key).with_suffix(".tmp")
+            tmp.write_text(json.dumps({"chunks": chunks}, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(self._path(key))
+            self._evict()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            total_bytes = sum(size for _, size, _ in entries)
+            while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+                _, size, path = entries.pop(0)
+                path.unlink(missing_ok=True)
+                total_bytes -= size
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the overall hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+response_cache = ResponseCache(CACHE_DIR, CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, enabled=CACHE_ENABLED)
+
+
+def cache_lookup(
+        client: OpenAI,
+        model: str,
+        messages: list,
+        temperature: float,
+        max_tokens: int,
+        use_cache: bool,
+        count: bool = True
+) -> tuple[str, list[str] | None]:
+    """
+    Look a request up in the response cache.
+
+    Returns (key, chunks): key is "" when caching is off for this call,
+    chunks is None on a miss. Pass the key to cache_store() afterwards.
+    """
+    if not (use_cache and response_cache.enabled):
+        return "", None
+    key = ResponseCache.make_key(str(client.base_url), model, messages, temperature, max_tokens)
+    return key, response_cache.get(key, count=count)
+
+
+def cache_store(key: str, chunks: list[str]) -> None:
+    """Store a completed reply under a key returned by cache_lookup()."""
+    if key and chunks:
+        response_cache.put(key, chunks)
+
+
+# ───────────────────────────────────────────────────────────────
+# Turn Metrics
+# ───────────────────────────────────────────────────────────────
+def new_turn_metrics(provider: str, model: str, **extra) -> dict:
+    """Create an empty metrics record for one streamed turn."""
+    return {
+        "provider": provider,
+        "model": model,
+        **extra,
+        "cached": False,
+        "ttft": None,
+        "total_time": 0.0,
+        "consumer_time": 0.0,
+        "context_time": 0.0,
+        "tokens": 0,
+        "tokens_per_sec": 0.0,
+        "mean_gap": 0.0,
+        "max_gap": 0.0,
+        "gap_total": 0.0,
+        "error": None,
+    }
+
+
+def finish_turn_metrics(metrics: dict, start: float) -> None:
+    """
+    Compute totals and rates once a turn's stream has ended.
+
+    total_time is wall time including the consumer (UI rendering); the
+    rate is computed over provider time only, excluding consumer_time.
+    """
+    metrics["total_time"] = time.perf_counter() - start
+    if metrics["tokens"] > 1:
+        metrics["mean_gap"] = metrics["gap_total"] / (metrics["tokens"] - 1)
+    stream_time = metrics["total_time"] - (metrics["ttft"] or 0.0) - metrics["consumer_time"]
+    if metrics["tokens"] and stream_time > 0:
+        metrics["tokens_per_sec"] = metrics["tokens"] / stream_time
+
+
+def record_turn_metrics(metrics: dict) -> None:
+    """Export a finished metrics record as a JSON line to METRICS_FILE, if configured."""
+    if not METRICS_FILE:
+        return
+    record = {k: v for k, v in metrics.items() if k != "gap_total"}
+    record["timestamp"] = time.time()
+    try:
+        with open(METRICS_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError:
+        pass
+
+
+def format_turn_metrics(metrics: dict) -> str:
+    """Render a turn's latency and throughput as a compact string."""
+    if metrics["error"]:
+        return f"error after {metrics['total_time']:.2f}s"
+    if metrics["cached"]:
+        # Replay latency says nothing about the provider, so skip TTFT and tok/s
+        note = f"{metrics['tokens']} tokens replayed from cache, {metrics['total_time']:.2f}s total"
+    else:
+        ttft = f"{metrics['ttft']:.2f}s" if metrics["ttft"] is not None else "n/a"
+        note = (
+            f"TTFT {ttft}, {metrics['tokens']} tokens, "
+            f"{metrics['tokens_per_sec']:.1f} tok/s, {metrics['total_time']:.2f}s total"
+        )
+    note += f" ({metrics['consumer_time']:.2f}s rendering"
+    if metrics["context_time"] >= 0.01:
+        note += f", {metrics['context_time']:.2f}s context"
+    return note + ")"
+
+
 # ───────────────────────────────────────────────────────────────
 # Streaming
 # ───────────────────────────────────────────────────────────────
-def stream_response(client: OpenAI, model: str, messages: list) -> Generator[str, None, None]:
-    """Stream tokens from LLM API endpoint in real-time."""
+def stream_response(
+        client: OpenAI,
+        model: str,
+        messages: list,
+        temperature: float = DEFAULT_TEMPERATURE,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        use_cache: bool = True,
+        metrics: dict | None = None
+) -> Generator[str, None, None]:
+    """
+    Stream tokens from LLM API endpoint in real-time, replaying cached replies when possible.
+
+    If a metrics dict is passed it is filled in with timing data for the
+    turn (see new_turn_metrics / finish_turn_metrics) as tokens arrive.
+    Chunks are timestamped on arrival, before being yielded; time spent
+    paused at the yield is counted as consumer_time, not as a token gap.
+    """
+    if metrics is None:
+        metrics = new_turn_metrics(str(client.base_url), model)
+    start = time.perf_counter()
+    last = start
+
+    def mark_token() -> None:
+        nonlocal last
+        now = time.perf_counter()
+        if metrics["tokens"] == 0:
+            metrics["ttft"] = now - start
+        else:
+            gap = now - last
+            metrics["gap_total"] += gap
+            metrics["max_gap"] = max(metrics["max_gap"], gap)
+        metrics["tokens"] += 1
+        last = now
+
+    def mark_resumed() -> None:
+        nonlocal last
+        now = time.perf_counter()
+        metrics["consumer_time"] += now - last
+        last = now
+
+    key, cached = cache_lookup(client, model, messages, temperature, max_tokens, use_cache)
+    if cached is not None:
+        metrics["cached"] = True
+        for chunk in cached:
+            mark_token()
+            yield chunk
+            mark_resumed()
+        finish_turn_metrics(metrics, start)
+        return
+
+    chunks = []
     try:
         stream = client.chat.completions.create(
             model=model,
             messages=messages,
-            temperature=0.75,
-            max_tokens=1024,
+            temperature=temperature,
+            max_tokens=max_tokens,
             stream=True
         )
         for chunk in stream:
             if chunk.choices[0].delta.content is not None:
+                chunks.append(chunk.choices[0].delta.content)
+                mark_token()
                 yield chunk.choices[0].delta.content
+                mark_resumed()
     except Exception as e:
+        metrics["error"] = str(e)
+        finish_turn_metrics(metrics, start)
         yield f"\n\n**Error:** {str(e)}"
+        return
+
+    finish_turn_metrics(metrics, start)
+
+    # Only complete, error-free replies are cached
+    cache_store(key, chunks)
+
+
+# ───────────────────────────────────────────────────────────────
+# Context Management
+# ───────────────────────────────────────────────────────────────
+def estimate_tokens(messages: list) -> int:
+    """Approximate token count for a message list (~4 characters per token plus per-message overhead)."""
+    return sum(4 + len(m["content"]) // 4 for m in messages)
+
+
+class ContextManager:
+    """
+    Keep the prompt sent to one model within a token budget.
+
+    The leading system prompt and the debate question are always kept.
+    When the full history exceeds the budget, older turns are dropped
+    ("sliding_window") or folded into a rolling summary ("summarize").
+    The "full" strategy sends the history unchanged.
+    """
+
+    def __init__(self, model: str, budget: int = 0, strategy: str = DEFAULT_CONTEXT_STRATEGY, summarizer=None):
+        self.budget = budget or MODEL_TOKEN_BUDGETS.get(model, DEFAULT_TOKEN_BUDGET)
+        if model in MODEL_CONTEXT_WINDOWS:
+            self.budget = min(self.budget, MODEL_CONTEXT_WINDOWS[model] - DEFAULT_MAX_TOKENS)
+        self.strategy = strategy if strategy in CONTEXT_STRATEGIES else DEFAULT_CONTEXT_STRATEGY
+        self.summarizer = summarizer
+        self.last_tokens = 0
+        self.last_dropped = 0
+        self.last_summarized = 0
+        self.last_error = ""
+        self._summary = ""
+        self._summarized = 0
+
+    def prepare(self, history: list) -> list:
+        """Return the messages to send for this turn, trimmed to the budget."""
+        self.last_error = ""
+        if self.strategy == "full" or estimate_tokens(history) <= self.budget:
+            self.last_dropped = 0
+            self.last_summarized = 0
+            self.last_tokens = estimate_tokens(history)
+            return list(history)
+
+        pinned_count = 2 if history and history[0]["role"] == "system" else 1
+        pinned = history[:pinned_count]
+        turns = history[pinned_count:]
+
+        available = self.budget - estimate_tokens(pinned)
+        if self.strategy == "summarize":
+            available -= SUMMARY_MAX_TOKENS + 4
+
+        # Walk back from the newest turn, always keeping at least the last one
+        start = len(turns)
+        used = 0
+        while start > 0:
+            cost = estimate_tokens([turns[start - 1]])
+            if used + cost > available and start < len(turns):
+                break
+            used += cost
+            start -= 1
+
+        messages = list(pinned)
+        summarized = 0
+        if self.strategy == "summarize" and start > 0:
+            summary = self._summarize(turns[:start])
+            if summary:
+                messages.append({"role": "system", "content": f"Summary of earlier debate turns: {summary}"})
+                summarized = self._summarized
+        messages.extend(turns[start:])
+
+        self.last_summarized = summarized
+        self.last_dropped = start - summarized
+        self.last_tokens = estimate_tokens(messages)
+        return messages
+
+    def _summarize(self, dropped: list) -> str:
+        """Fold newly dropped turns into the rolling summary."""
+        if self.summarizer is None or len(dropped) <= self._summarized:
+            return self._summary
+
+        new_turns = "\n\n".join(f"{m['role']}: {m['content']}" for m in dropped[self._summarized:])
+        text = f"Previous summary: {self._summary}\n\n{new_turns}" if self._summary else new_turns
+        try:
+            self._summary = self.summarizer(text)
+            self._summarized = len(dropped)
+        except Exception as e:
+            self.last_error = str(e)
+        return self._summary
+
+
+def make_summarizer(client: OpenAI, model: str, use_cache: bool = True):
+    """
+    Build a summarizer callable that condenses debate turns with the given model.
+
+    Summaries are deterministic (temperature 0) and go through the response
+    cache, so re-running a debate reproduces the same later prompts. Summary
+    lookups are kept out of the cache hit/miss stats, which count turns only.
+    """
+    def summarize(text: str) -> str:
+        messages = [
+            {
+                "role": "system",
+                "content": "Summarize the key arguments of this debate excerpt concisely. "
+                           "Preserve each side's main claims and evidence.",
+            },
+            {"role": "user", "content": text},
+        ]
+        key, cached = cache_lookup(client, model, messages, 0.0, SUMMARY_MAX_TOKENS, use_cache, count=False)
+        if cached is not None:
+            return "".join(cached)
+
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.0,
+            max_tokens=SUMMARY_MAX_TOKENS,
+        )
+        summary = (response.choices[0].message.content or "").strip()
+        cache_store(key, [summary] if summary else [])
+        return summary
+    return summarize
+
+
+def format_turn_footer(context: ContextManager, metrics: dict) -> str:
+    """Render the tokens sent and timing for the last turn as a small markdown note."""
+    note = f"*~{context.last_tokens} tokens sent"
+    if context.strategy != "full":
+        note += f" (budget ~{context.budget})"
+    if context.last_summarized:
+        note += f", {context.last_summarized} older messages summarized"
+    if context.last_dropped:
+        note += f", {context.last_dropped} older messages dropped"
+    if context.last_error:
+        note += f", summary failed: {context.last_error}"
+    return note + f" · {format_turn_metrics(metrics)}*"
 
 
 # ───────────────────────────────────────────────────────────────
@@ -109,6 +540,10 @@ def run_debate(
         llm1_model: str,
         llm2_model: str,
         rounds: int,
+        use_cache: bool = True,
+        context_strategy: str = DEFAULT_CONTEXT_STRATEGY,
+        llm1_budget: int = 0,
+        llm2_budget: int = 0,
         progress=gr.Progress(track_tqdm=True)
 ):
     """Execute multi-round debate between two LLMs with custom system prompts."""
@@ -140,6 +575,23 @@ def run_debate(
         yield "**Error:** Invalid LLM 2 model name."
         return
 
+    if context_strategy not in CONTEXT_STRATEGIES:
+        yield "**Error:** Invalid context strategy."
+        return
+
+    llm1_budget = int(llm1_budget or 0)
+    llm2_budget = int(llm2_budget or 0)
+    if llm1_budget < 0 or llm2_budget < 0:
+        yield "**Error:** Token budget cannot be negative."
+        return
+
+    # A budget only means something when the history is trimmed
+    if context_strategy == "full" and (llm1_budget or llm2_budget):
+        context_strategy = "sliding_window"
+
+    context1 = ContextManager(llm1_model, llm1_budget, context_strategy, make_summarizer(groq_client, llm1_model, use_cache))
+    context2 = ContextManager(llm2_model, llm2_budget, context_strategy, make_summarizer(openai_client, llm2_model, use_cache))
+
     # Initialize output
     output = ""
     output += (
@@ -147,8 +599,12 @@ def run_debate(
         f"**Topic:** {question}\n"
         f"**Rounds:** {rounds}\n"
         f"**LLM 1:** {llm1_model}\n"
-        f"**LLM 2:** {llm2_model}\n\n"
+        f"**LLM 2:** {llm2_model}\n"
     )
+    if context_strategy == "full":
+        output += "**Context:** full history\n\n"
+    else:
+        output += f"**Context:** {context_strategy} (budget ~{context1.budget} / ~{context2.budget} tokens)\n\n"
 
     if llm1_system:
         output += f"**LLM 1 System Prompt:** {llm1_system}\n\n"
@@ -170,6 +626,7 @@ def run_debate(
     history2.append({"role": "user", "content": question})
 
     # Run debate rounds
+    turn_metrics = []
     for round_num in range(1, rounds + 1):
         output += f"### Round {round_num} of {rounds}\n\n"
         yield output
@@ -179,36 +636,76 @@ def run_debate(
         yield output
 
         reply1 = ""
-        for token in stream_response(groq_client, llm1_model, history1):
+        context_start = time.perf_counter()
+        messages1 = context1.prepare(history1)
+        metrics1 = new_turn_metrics(str(groq_client.base_url), llm1_model, round=round_num, speaker="LLM 1",
+                                      prompt_tokens=context1.last_tokens)
+        metrics1["context_time"] = time.perf_counter() - context_start
+        for token in stream_response(groq_client, llm1_model, messages1, use_cache=use_cache, metrics=metrics1):
             reply1 += token
             yield output + reply1
 
-        output += reply1 + "\n\n"
+        output += reply1 + "\n\n" + format_turn_footer(context1, metrics1) + "\n\n"
         yield output
 
+        record_turn_metrics(metrics1)
+        turn_metrics.append(metrics1)
         history1.append({"role": "assistant", "content": reply1})
         history2.append({"role": "user", "content": reply1})
 
-        time.sleep(0.3)
+        time.sleep(TURN_DELAY)
 
         # LLM 2's turn
         output += f"**LLM 2** ({llm2_model}):\n\n"
         yield output
 
         reply2 = ""
-        for token in stream_response(openai_client, llm2_model, history2):
+        context_start = time.perf_counter()
+        messages2 = context2.prepare(history2)
+        metrics2 = new_turn_metrics(str(openai_client.base_url), llm2_model, round=round_num, speaker="LLM 2",
+                                      prompt_tokens=context2.last_tokens)
+        metrics2["context_time"] = time.perf_counter() - context_start
+        for token in stream_response(openai_client, llm2_model, messages2, use_cache=use_cache, metrics=metrics2):
             reply2 += token
             yield output + reply2
 
-        output += reply2 + "\n\n───────────────────────────────────────────────\n\n"
+        output += reply2 + "\n\n" + format_turn_footer(context2, metrics2) + "\n\n"
+        output += "───────────────────────────────────────────────\n\n"
         yield output
 
+        record_turn_metrics(metrics2)
+        turn_metrics.append(metrics2)
         history2.append({"role": "assistant", "content": reply2})
         history1.append({"role": "user", "content": reply2})
 
         progress((round_num / rounds), desc=f"Round {round_num}/{rounds}")
 
     output += "\n**Debate Complete** ✓"
+    # Cached replays are excluded from latency/throughput averages
+    live = [m for m in turn_metrics if not m["cached"] and m["ttft"] is not None]
+    cached_turns = sum(1 for m in turn_metrics if m["cached"])
+    if turn_metrics:
+        output += f"\n\n*{len(turn_metrics)} turns ({len(turn_metrics) - cached_turns} live, {cached_turns} cached): "
+        if live:
+            output += (
+                f"mean TTFT {sum(m['ttft'] for m in live) / len(live):.2f}s, "
+                f"mean {sum(m['tokens_per_sec'] for m in live) / len(live):.1f} tok/s, "
+            )
+        output += (
+            f"{sum(m['tokens'] for m in turn_metrics)} tokens, "
+            f"{sum(m['total_time'] - m['consumer_time'] for m in turn_metrics):.1f}s streaming, "
+            f"{sum(m['consumer_time'] for m in turn_metrics):.1f}s rendering, "
+            f"{sum(m['context_time'] for m in turn_metrics):.1f}s context, "
+            f"{sum(1 for m in turn_metrics if m['error'])} errors*"
+        )
+    if use_cache and response_cache.enabled and turn_metrics:
+        hits = sum(1 for m in turn_metrics if m["cached"])
+        stats = response_cache.stats()
+        output += (
+            f"\n\n*Response cache (this debate): {hits} hits / {len(turn_metrics) - hits} misses "
+            f"({hits / len(turn_metrics):.0%} hit rate) · "
+            f"process-wide: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%})*"
+        )
     yield output
 
 
@@ -262,6 +759,30 @@ with gr.Blocks(theme=gr.themes.Soft(), title="LLM Debate Arena") as demo:
                 value=DEFAULT_ROUNDS,
                 label="Number of Rounds"
             )
+            cache_checkbox = gr.Checkbox(
+                label="Use Response Cache",
+                value=CACHE_ENABLED,
+                interactive=CACHE_ENABLED
+            )
+
+        with gr.Row():
+            context_strategy = gr.Dropdown(
+                choices=CONTEXT_STRATEGIES,
+                value=DEFAULT_CONTEXT_STRATEGY,
+                label="Context Strategy"
+            )
+            llm1_budget = gr.Number(
+                value=0,
+                minimum=0,
+                precision=0,
+                label="LLM 1 Token Budget (0 = model default)"
+            )
+            llm2_budget = gr.Number(
+                value=0,
+                minimum=0,
+                precision=0,
+                label="LLM 2 Token Budget (0 = model default)"
+            )
             start_btn = gr.Button("Start Debate", variant="primary", size="lg")
 
     debate_output = gr.Markdown(
@@ -279,13 +800,15 @@ with gr.Blocks(theme=gr.themes.Soft(), title="LLM Debate Arena") as demo:
     # Event handlers
     start_btn.click(
         fn=run_debate,
-        inputs=[question_input, llm1_system, llm2_system, llm1_model, llm2_model, rounds_slider],
+        inputs=[question_input, llm1_system, llm2_system, llm1_model, llm2_model, rounds_slider, cache_checkbox,
+                context_strategy, llm1_budget, llm2_budget],
         outputs=debate_output,
     )
 
     question_input.submit(
         fn=run_debate,
-        inputs=[question_input, llm1_system, llm2_system, llm1_model, llm2_model, rounds_slider],
+        inputs=[question_input, llm1_system, llm2_system, llm1_model, llm2_model, rounds_slider, cache_checkbox,
+                context_strategy, llm1_budget, llm2_budget],
         outputs=debate_output,
     )
 